@@ -10,17 +10,68 @@ import cv2
 import numpy as np
 import mediapipe as mp
 import math
+import threading
+import queue
+import logging
+from collections import deque, namedtuple
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+logger = logging.getLogger(__name__)
 
 # Initialize MediaPipe
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
 
+# Draw the MediaPipe hand skeleton (visual only, gameplay doesn't need it; toggled from the sidebar)
+SHOW_LANDMARKS = False
+
+# Run hand detection every N frames, reuse landmarks in between
+PREDICTION_INTERVAL = 2
+
+# Width of the downscaled frame fed to MediaPipe (landmarks are normalized, so no rescaling needed)
+DETECTION_WIDTH = 320
+
+# Seconds without frames before a tracker thread exits and forgets its last hand (stream stopped or game replaced)
+TRACKER_IDLE_TIMEOUT = 2.0
+
+# Bird physics (per frame)
+GRAVITY = 0.3
+AIR_RESISTANCE = 0.995
+
+# Number of flight trajectory points kept for the trail
+TRAIL_LENGTH = 20
+
+# Trail fade-in gradient is approximated with this many color bands (one polylines call each)
+TRAIL_COLOR_BANDS = 4
+
+# Target radius (pixels)
+TARGET_RADIUS = 20
+
+# Target layouts per level, as (x, y) offsets in from the bottom-right corner of the game area
+LEVEL_TARGET_OFFSETS = {
+    1: np.array([[100, 100], [150, 150], [200, 100]], dtype=np.float64),
+    2: np.array([[80, 80], [120, 120], [160, 160], [200, 80]], dtype=np.float64),
+    3: np.array([[70, 70], [110, 110], [150, 150], [190, 110], [230, 70]], dtype=np.float64),
+    # Pyramid shape
+    4: np.array([[100, 60], [140, 60], [180, 60], [120, 100], [160, 100], [140, 140]], dtype=np.float64),
+    # Complex layout
+    5: np.array([[80, 60], [120, 100], [160, 140], [200, 100], [240, 60], [130, 180], [170, 180]], dtype=np.float64),
+}
+
 @st.cache_resource
 def get_hand_detector():
     """Get hand detector"""
     return mp_hands.Hands(
         static_image_mode=False,
-        max_num_hands=2,
+        model_complexity=0,  # Lite model, enough for pinch/fist gestures
+        max_num_hands=1,  # Game is controlled by a single hand
         min_detection_confidence=0.7,
         min_tracking_confidence=0.5
     )
@@ -36,7 +87,10 @@ class SimpleBird:
         self.vel_x = 0
         self.vel_y = 0
         self.is_flying = False
-        self.trail = []  # Flight trajectory
+        # Flight trajectory ring buffer (most recent TRAIL_LENGTH points)
+        self.trail = np.zeros((TRAIL_LENGTH, 2), dtype=np.int32)
+        self.trail_len = 0
+        self.trail_head = 0  # Next slot to write
         
     def reset(self):
         """Reset bird to initial position"""
@@ -45,69 +99,133 @@ class SimpleBird:
         self.vel_x = 0
         self.vel_y = 0
         self.is_flying = False
-        self.trail = []
-    
-    def update(self):
-        """Update bird physics"""
-        if self.is_flying:
-            self.vel_y += 0.3  # Gravity
-            self.vel_x *= 0.995  # Air resistance
-            self.x += self.vel_x
-            self.y += self.vel_y
-            
-            # Record trajectory
-            if len(self.trail) < 20:
-                self.trail.append((int(self.x), int(self.y)))
+        self.clear_trail()
+    
+    def clear_trail(self):
+        """Empty the flight trajectory"""
+        self.trail_len = 0
+        self.trail_head = 0
+    
+    def add_trail_point(self):
+        """Record current position in the trajectory ring buffer"""
+        self.trail[self.trail_head] = (int(self.x), int(self.y))
+        self.trail_head = (self.trail_head + 1) % TRAIL_LENGTH
+        if self.trail_len < TRAIL_LENGTH:
+            self.trail_len += 1
+    
+    def trail_points(self):
+        """Trajectory points in chronological order"""
+        if self.trail_len < TRAIL_LENGTH:
+            return self.trail[:self.trail_len]
+        return np.concatenate((self.trail[self.trail_head:], self.trail[:self.trail_head]))
     
     def launch(self, vel_x, vel_y):
         """Launch bird"""
         self.vel_x = vel_x
         self.vel_y = vel_y
         self.is_flying = True
-        self.trail = [(int(self.x), int(self.y))]
+        self.clear_trail()
+        self.add_trail_point()
     
     def draw(self, frame):
         """Draw bird and trajectory"""
         # Draw flight trajectory
-        for i in range(1, len(self.trail)):
-            alpha = i / len(self.trail)
-            color = (int(255 * alpha), int(255 * alpha), 0)
-            cv2.line(frame, self.trail[i-1], self.trail[i], color, 2)
+        trail = self.trail_points()
+        num_points = len(trail)
+        if num_points > 1:
+            bounds = np.linspace(0, num_points - 1, min(TRAIL_COLOR_BANDS, num_points - 1) + 1).astype(int)
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                alpha = end / num_points
+                color = (int(255 * alpha), int(255 * alpha), 0)
+                cv2.polylines(frame, [trail[start:end + 1].reshape(-1, 1, 2)], False, color, 2)
         
         # Draw bird body
-        cv2.circle(frame, (int(self.x), int(self.y)), self.radius, (0, 255, 255), -1)
+        x, y, radius = int(self.x), int(self.y), self.radius
+        cv2.circle(frame, (x, y), radius, (0, 255, 255), -1)
         
         # Draw eyes
-        eye_offset = self.radius // 3
-        cv2.circle(frame, (int(self.x - eye_offset), int(self.y - eye_offset)), 3, (0, 0, 0), -1)
-        cv2.circle(frame, (int(self.x + eye_offset), int(self.y - eye_offset)), 3, (0, 0, 0), -1)
+        eye_offset = radius // 3
+        cv2.circle(frame, (x - eye_offset, y - eye_offset), 3, (0, 0, 0), -1)
+        cv2.circle(frame, (x + eye_offset, y - eye_offset), 3, (0, 0, 0), -1)
 
-class SimpleTarget:
-    """Simplified target class"""
-    def __init__(self, x, y, radius=20):
-        self.x = x
-        self.y = y
-        self.radius = radius
-        self.is_destroyed = False
-        
-    def check_collision(self, bird):
-        """Check collision with bird"""
-        if self.is_destroyed:
-            return False
-        distance = math.sqrt((self.x - bird.x)**2 + (self.y - bird.y)**2)
-        if distance < (self.radius + bird.radius):
-            self.is_destroyed = True
-            return True
-        return False
-    
-    def draw(self, frame):
-        """Draw target"""
-        if not self.is_destroyed:
-            cv2.circle(frame, (int(self.x), int(self.y)), self.radius, (0, 255, 0), -1)
-            # Draw eyes
-            eye_offset = self.radius // 3
-            cv2.circle(frame, (int(self.x - eye_offset), int(self.y - eye_offset)), 3, (0, 0, 0), -1)
-            cv2.circle(frame, (int(self.x + eye_offset), int(self.y - eye_offset)), 3, (0, 0, 0), -1)
+@njit(cache=True)
+def step_physics(x, y, vel_x, vel_y, is_flying, tx, ty, hit_dist_sq, alive, min_x, max_x, max_y):
+    """Advance bird one frame and resolve target hits (marks hit targets dead in place)"""
+    if is_flying:
+        vel_y += GRAVITY
+        vel_x *= AIR_RESISTANCE
+        x += vel_x
+        y += vel_y
+    
+    # Check collisions (squared distances)
+    hits = 0
+    for i in range(tx.shape[0]):
+        if alive[i]:
+            dx = tx[i] - x
+            dy = ty[i] - y
+            if dx * dx + dy * dy < hit_dist_sq[i]:
+                alive[i] = False
+                hits += 1
+    
+    out_of_bounds = x > max_x or y > max_y or x < min_x
+    return x, y, vel_x, vel_y, hits, out_of_bounds
+
+# Compile the kernel at import (same argument types as SimpleGame.update) so the first frame doesn't stall
+step_physics(0.0, 0.0, 0.0, 0.0, False, np.zeros(1), np.zeros(1), np.zeros(1), np.ones(1, dtype=bool), 0.0, 1.0, 1.0)
+
+def draw_target(frame, x, y, radius):
+    """Draw target (integer pixel coordinates)"""
+    cv2.circle(frame, (x, y), radius, (0, 255, 0), -1)
+    # Draw eyes
+    eye_offset = radius // 3
+    cv2.circle(frame, (x - eye_offset, y - eye_offset), 3, (0, 0, 0), -1)
+    cv2.circle(frame, (x + eye_offset, y - eye_offset), 3, (0, 0, 0), -1)
+
+def blit(frame, sprite, x, y):
+    """Copy a pre-rendered sprite onto frame at (x, y), clipped to frame bounds"""
+    frame_h, frame_w = frame.shape[:2]
+    x1, y1 = max(x, 0), max(y, 0)
+    x2, y2 = min(x + sprite.shape[1], frame_w), min(y + sprite.shape[0], frame_h)
+    if x1 < x2 and y1 < y2:
+        frame[y1:y2, x1:x2] = sprite[y1 - y:y2 - y, x1 - x:x2 - x]
+
+def blend(frame, color, alpha, x, y):
+    """Blend a solid color onto frame at (x, y) by per-pixel alpha coverage, clipped to frame bounds"""
+    frame_h, frame_w = frame.shape[:2]
+    x1, y1 = max(x, 0), max(y, 0)
+    x2, y2 = min(x + alpha.shape[1], frame_w), min(y + alpha.shape[0], frame_h)
+    if x1 < x2 and y1 < y2:
+        roi = frame[y1:y2, x1:x2]
+        roi[:] = roi + (color - roi) * alpha[y1 - y:y2 - y, x1 - x:x2 - x] + 0.5
+
+class TextSprite:
+    """Text rasterized once as coverage, alpha-blended instead of calling cv2.putText"""
+    def __init__(self, text, font_scale, color, thickness):
+        (text_w, text_h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+        self.pad = thickness
+        self.ascent = text_h + self.pad  # Sprite top to text baseline
+        coverage = np.zeros((self.ascent + baseline + self.pad, text_w + 2 * self.pad), dtype=np.uint8)
+        cv2.putText(coverage, text, (self.pad, self.ascent), cv2.FONT_HERSHEY_SIMPLEX, font_scale, 255, thickness)
+        # Keep partial coverage so antialiased edges (always on in OpenCV 5) blend instead of leaving dark fringes
+        self.alpha = (coverage / np.float32(255))[:, :, None]
+        self.color = np.array(color, dtype=np.float32)
+    
+    def draw(self, frame, x, y):
+        """Draw text with bottom-left baseline at (x, y), same origin as cv2.putText"""
+        blend(frame, self.color, self.alpha, x - self.pad, y - self.ascent)
+
+class FrameBuffers:
+    """Reusable frame-sized buffers, reallocated only when the frame size changes"""
+    def __init__(self):
+        self.buffers = {}
+    
+    def get(self, name, shape, dtype=np.uint8):
+        """Get buffer by name with given shape"""
+        buffer = self.buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=dtype)
+            self.buffers[name] = buffer
+        return buffer
 
 class SimpleGame:
     """Simplified game class"""
@@ -126,6 +244,22 @@ class SimpleGame:
         self.last_fist_state = False  # Fist state of previous frame
         self.pause_message_timer = 0  # Pause message display timer
         
+        # Hand detection cache
+        self.frame_index = 0  # Processed frame counter
+        self.tracker = HandTracker()  # Per game, so hand results never leak between sessions
+        # Reused per game rather than module-wide, so concurrent sessions never share a buffer
+        self.frame_buffers = FrameBuffers()
+        self.pixel_buffer = np.empty((21, 2), dtype=np.float32)  # Landmark pixel coordinates (x, y)
+        # Frame size is fixed for the session, so precompute landmark scaling and detection size once
+        self.pixel_scale = np.array([width, height], dtype=np.float32)
+        self.detection_size = (DETECTION_WIDTH, int(DETECTION_WIDTH * height / width))
+        
+        # UI sprite caches (re-rendered only when the displayed values change)
+        self.hud_key = None
+        self.hud_sprite = None
+        self.button_sprite_cache = {}  # (state, progress) -> rendered button
+        self.overlay_scratch = None  # Reused buffer for semi-transparent overlays
+        
         # Game area centering settings
         self.game_area_width = min(width * 0.8, 800)  # Game area width, max 800 pixels
         self.game_area_height = min(height * 0.8, 600)  # Game area height, max 600 pixels
@@ -141,6 +275,7 @@ class SimpleGame:
         self.transition_progress = 0  # 0-100
         self.transition_direction = 'left'  # 'left' or 'right'
         self.old_game_surface = None
+        self.transition_layers = None  # Pre-rendered (layer, mask) pairs and level label for the current transition
         
         # Restart button - optimized position to left-center for easier access
         self.reset_button = {
@@ -162,58 +297,43 @@ class SimpleGame:
             'trigger_cooldown': 30  # Brief cooldown after trigger (frames, about 0.5 seconds)
         }
         
+        self.build_background_layer()
         self.init_level()
     
+    def build_background_layer(self):
+        """Pre-render game area background and ground tint once"""
+        # Pixel bounds of the game area (inclusive rectangle -> exclusive slice)
+        self.bg_x1 = int(self.game_offset_x)
+        self.bg_y1 = int(self.game_offset_y)
+        self.bg_x2 = int(self.game_offset_x + self.game_area_width) + 1
+        self.bg_y2 = int(self.game_offset_y + self.game_area_height) + 1
+        self.ground_y1 = int(self.game_offset_y + self.game_area_height - 50)
+        
+        area_width = self.bg_x2 - self.bg_x1
+        self.bg_layer = np.full((self.bg_y2 - self.bg_y1, area_width, 3), (240, 248, 255), dtype=np.uint8)  # Light blue background
+        self.ground_layer = np.full((self.bg_y2 - self.ground_y1, area_width, 3), (34, 139, 34), dtype=np.uint8)
+        
+        # Slingshot base position (integer pixels)
+        self.sling_x = int(self.game_offset_x + 100)
+        self.sling_y = int(self.game_offset_y + self.game_area_height - 100)
+    
     def init_level(self):
         """Initialize current level"""
         self.bird = SimpleBird(self.game_offset_x + 100, self.game_offset_y + self.game_area_height - 150)
         
-        # Generate different target configurations based on level
-        if self.current_level == 1:
-            self.targets = [
-                SimpleTarget(self.game_offset_x + self.game_area_width - 100, self.game_offset_y + self.game_area_height - 100),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 150, self.game_offset_y + self.game_area_height - 150),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 200, self.game_offset_y + self.game_area_height - 100),
-            ]
-        elif self.current_level == 2:
-            self.targets = [
-                SimpleTarget(self.game_offset_x + self.game_area_width - 80, self.game_offset_y + self.game_area_height - 80),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 120, self.game_offset_y + self.game_area_height - 120),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 160, self.game_offset_y + self.game_area_height - 160),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 200, self.game_offset_y + self.game_area_height - 80),
-            ]
-        elif self.current_level == 3:
-            self.targets = [
-                SimpleTarget(self.game_offset_x + self.game_area_width - 70, self.game_offset_y + self.game_area_height - 70),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 110, self.game_offset_y + self.game_area_height - 110),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 150, self.game_offset_y + self.game_area_height - 150),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 190, self.game_offset_y + self.game_area_height - 110),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 230, self.game_offset_y + self.game_area_height - 70),
-            ]
-        elif self.current_level == 4:
-            # Pyramid shape
-            self.targets = [
-                SimpleTarget(self.game_offset_x + self.game_area_width - 100, self.game_offset_y + self.game_area_height - 60),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 140, self.game_offset_y + self.game_area_height - 60),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 180, self.game_offset_y + self.game_area_height - 60),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 120, self.game_offset_y + self.game_area_height - 100),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 160, self.game_offset_y + self.game_area_height - 100),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 140, self.game_offset_y + self.game_area_height - 140),
-            ]
-        else:  # Level 5 and beyond
-            # Complex layout
-            self.targets = [
-                SimpleTarget(self.game_offset_x + self.game_area_width - 80, self.game_offset_y + self.game_area_height - 60),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 120, self.game_offset_y + self.game_area_height - 100),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 160, self.game_offset_y + self.game_area_height - 140),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 200, self.game_offset_y + self.game_area_height - 100),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 240, self.game_offset_y + self.game_area_height - 60),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 130, self.game_offset_y + self.game_area_height - 180),
-                SimpleTarget(self.game_offset_x + self.game_area_width - 170, self.game_offset_y + self.game_area_height - 180),
-            ]
+        # Target layout for this level (levels beyond the table reuse the last layout)
+        offsets = LEVEL_TARGET_OFFSETS[min(self.current_level, len(LEVEL_TARGET_OFFSETS))]
+        self.tx = self.game_offset_x + self.game_area_width - offsets[:, 0]
+        self.ty = self.game_offset_y + self.game_area_height - offsets[:, 1]
+        self.tr = np.full(len(offsets), TARGET_RADIUS, dtype=np.float64)
+        self.alive = np.ones(len(offsets), dtype=bool)
+        self.remaining_targets = len(offsets)
+        self.game_won = False
+        # Squared bird-target hit distance, constant for the whole level
+        self.hit_dist_sq = (self.tr + self.bird.radius) ** 2
         
         self.pulling = False
-        
+    
     def update(self):
         """Update game state"""
         # Priority handling of transition animation
@@ -221,28 +341,33 @@ class SimpleGame:
             self.update_transition()
             return
         
-        self.bird.update()
-        
-        # Check collisions
-        for target in self.targets:
-            if target.check_collision(self.bird):
-                self.score += 100
+        # Bird physics and collisions in one compiled step
+        bird = self.bird
+        bird.x, bird.y, bird.vel_x, bird.vel_y, hits, out_of_bounds = step_physics(
+            float(bird.x), float(bird.y), float(bird.vel_x), float(bird.vel_y), bird.is_flying,
+            self.tx, self.ty, self.hit_dist_sq, self.alive,
+            float(self.game_offset_x), float(self.game_offset_x + self.game_area_width),
+            float(self.game_offset_y + self.game_area_height))
+        if bird.is_flying:
+            # Record trajectory
+            bird.add_trail_point()
         
         # Check boundaries (based on game area)
-        if (self.bird.x > self.game_offset_x + self.game_area_width or 
-            self.bird.y > self.game_offset_y + self.game_area_height or 
-            self.bird.x < self.game_offset_x):
-            if self.bird.is_flying:
-                self.bird.reset()
+        if out_of_bounds and bird.is_flying:
+            bird.reset()
         
-        # Check victory condition
-        self.game_won = all(target.is_destroyed for target in self.targets)
+        # Update score and check victory condition (only changes when something was hit)
+        if hits:
+            self.score += 100 * hits
+            self.remaining_targets = int(np.count_nonzero(self.alive))
+            self.game_won = self.remaining_targets == 0
     
     def start_pull(self, x, y):
         """Start pulling slingshot"""
         if not self.bird.is_flying and not self.game_won:
-            distance = math.sqrt((x - self.bird.x)**2 + (y - self.bird.y)**2)
-            if distance < 40:  # Near the bird
+            dx = x - self.bird.x
+            dy = y - self.bird.y
+            if dx * dx + dy * dy < 40 * 40:  # Near the bird
                 self.pulling = True
     
     def update_pull(self, x, y):
@@ -250,13 +375,14 @@ class SimpleGame:
         if self.pulling:
             # Limit slingshot pulling distance
             max_distance = 100
-            distance = math.sqrt((x - self.bird.start_x)**2 + (y - self.bird.start_y)**2)
-            if distance > max_distance:
-                # Limit within maximum distance
-                direction_x = (x - self.bird.start_x) / distance
-                direction_y = (y - self.bird.start_y) / distance
-                x = self.bird.start_x + direction_x * max_distance
-                y = self.bird.start_y + direction_y * max_distance
+            dx = x - self.bird.start_x
+            dy = y - self.bird.start_y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq > max_distance * max_distance:
+                # Limit within maximum distance (only take the root when clamping)
+                scale = max_distance / math.sqrt(distance_sq)
+                x = self.bird.start_x + dx * scale
+                y = self.bird.start_y + dy * scale
             
             self.pull_x = x
             self.pull_y = y
@@ -274,8 +400,9 @@ class SimpleGame:
     def reset_game(self):
         """Reset game"""
         self.bird.reset()
-        for target in self.targets:
-            target.is_destroyed = False
+        self.tracker.clear()
+        self.alive[:] = True
+        self.remaining_targets = len(self.alive)
         self.score = 0
         self.game_won = False
         self.pulling = False
@@ -291,7 +418,7 @@ class SimpleGame:
         self.is_transitioning = True
         self.transition_progress = 0
         self.transition_direction = direction
-        # Here we can save current screen state for animation
+        self.transition_layers = None  # Rendered on first transition frame
     
     def update_transition(self):
         """Update transition animation"""
@@ -409,46 +536,37 @@ class SimpleGame:
             self.draw_transition(frame)
             return
         
-        # Draw game area background
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (int(self.game_offset_x), int(self.game_offset_y)), 
-                     (int(self.game_offset_x + self.game_area_width), 
-                      int(self.game_offset_y + self.game_area_height)), 
-                     (240, 248, 255), -1)  # Light blue background
-        cv2.addWeighted(overlay, 0.1, frame, 0.9, 0, frame)
+        # Draw game area background (pre-rendered layer)
+        roi = frame[self.bg_y1:self.bg_y2, self.bg_x1:self.bg_x2]
+        cv2.addWeighted(self.bg_layer, 0.1, roi, 0.9, 0, roi)
         
         # Draw game area border
-        cv2.rectangle(frame, (int(self.game_offset_x), int(self.game_offset_y)), 
-                     (int(self.game_offset_x + self.game_area_width), 
-                      int(self.game_offset_y + self.game_area_height)), 
-                     (200, 200, 200), 2)
-        
-        # Draw semi-transparent ground (within game area)
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (int(self.game_offset_x), int(self.game_offset_y + self.game_area_height - 50)), 
-                     (int(self.game_offset_x + self.game_area_width), int(self.game_offset_y + self.game_area_height)), 
-                     (34, 139, 34), -1)
-        cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+        cv2.rectangle(frame, (self.bg_x1, self.bg_y1), (self.bg_x2 - 1, self.bg_y2 - 1), (200, 200, 200), 2)
+        
+        # Draw semi-transparent ground (pre-rendered layer, within game area)
+        roi = frame[self.ground_y1:self.bg_y2, self.bg_x1:self.bg_x2]
+        cv2.addWeighted(self.ground_layer, 0.3, roi, 0.7, 0, roi)
         
         # Draw slingshot (within game area)
-        sling_x, sling_y = self.game_offset_x + 100, self.game_offset_y + self.game_area_height - 100
-        cv2.rectangle(frame, (int(sling_x - 10), int(sling_y - 60)), (int(sling_x + 10), int(sling_y)), (139, 69, 19), -1)
+        sling_x, sling_y = self.sling_x, self.sling_y
+        cv2.rectangle(frame, (sling_x - 10, sling_y - 60), (sling_x + 10, sling_y), (139, 69, 19), -1)
         
         if self.pulling:
             # Pulled slingshot state
-            cv2.line(frame, (int(sling_x - 10), int(sling_y - 30)), (int(self.bird.x), int(self.bird.y)), (0, 0, 255), 3)
-            cv2.line(frame, (int(sling_x + 10), int(sling_y - 30)), (int(self.bird.x), int(self.bird.y)), (0, 0, 255), 3)
+            bird_pos = (int(self.bird.x), int(self.bird.y))
+            cv2.line(frame, (sling_x - 10, sling_y - 30), bird_pos, (0, 0, 255), 3)
+            cv2.line(frame, (sling_x + 10, sling_y - 30), bird_pos, (0, 0, 255), 3)
             
             # Show tension line
-            cv2.line(frame, (int(self.bird.start_x), int(self.bird.start_y)), 
-                    (int(self.bird.x), int(self.bird.y)), (255, 255, 0), 2)
+            cv2.line(frame, (int(self.bird.start_x), int(self.bird.start_y)), bird_pos, (255, 255, 0), 2)
         else:
             # Normal slingshot
-            cv2.line(frame, (int(sling_x - 10), int(sling_y - 30)), (int(sling_x + 10), int(sling_y - 30)), (0, 0, 255), 3)
+            cv2.line(frame, (sling_x - 10, sling_y - 30), (sling_x + 10, sling_y - 30), (0, 0, 255), 3)
         
         # Draw targets
-        for target in self.targets:
-            target.draw(frame)
+        for x, y, radius, alive in zip(self.tx.tolist(), self.ty.tolist(), self.tr.tolist(), self.alive.tolist()):
+            if alive:
+                draw_target(frame, int(x), int(y), int(radius))
         
         # Draw bird
         self.bird.draw(frame)
@@ -462,71 +580,104 @@ class SimpleGame:
         progress = self.transition_progress / 100.0
         
         if self.transition_direction == 'left':
+            if self.transition_layers is None:
+                self.build_transition_layers()
+            current_layer, current_mask, next_layer, next_mask, level_text = self.transition_layers
+            
             # Current screen slides left
             offset_x = int(self.width * progress)
             
-            # Draw sliding current screen
+            # Copy visible part of current level
             if offset_x < self.width:
-                # Create sub-region to draw current level
-                current_roi = frame[:, offset_x:]
-                if current_roi.shape[1] > 0:
-                    self.draw_current_level(current_roi, -offset_x)
+                np.copyto(frame[:, offset_x:], current_layer[:, offset_x:], where=current_mask[:, offset_x:])
             
-            # Draw sliding in new screen
+            # Copy sliding in new screen (window into the wider next-level layer)
             if offset_x > 0:
-                new_roi = frame[:, :offset_x]
-                if new_roi.shape[1] > 0:
-                    self.draw_next_level_preview(new_roi, self.width - offset_x)
+                np.copyto(frame[:, :offset_x], next_layer[:, offset_x:2 * offset_x],
+                          where=next_mask[:, offset_x:2 * offset_x])
+                # Label sits at x = width + 10 in the next-level layer, clipped to the same window
+                level_text.draw(frame[:, :offset_x], self.width + 10 - offset_x, self.height // 2)
         
         # Draw transition progress
         cv2.putText(frame, f"Level {self.current_level}", 
                    (self.width//2 - 50, 50), 
                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
     
-    def draw_current_level(self, roi, offset_x):
-        """Draw current level to specified area"""
-        # Simplified processing here, draw some basic elements
-        height, width = roi.shape[:2]
+    def build_transition_layers(self):
+        """Pre-render current level and next level preview once per transition"""
+        height, width = self.height, self.width
         
-        # Draw ground
-        cv2.rectangle(roi, (0, height - 50), (width, height), (34, 139, 34), -1)
+        # Current level: ground and remaining targets, in frame coordinates
+        current_layer = np.zeros((height, width, 3), dtype=np.uint8)
+        cv2.rectangle(current_layer, (0, height - 50), (width, height), (34, 139, 34), -1)
+        for tx, ty, radius, alive in zip(self.tx, self.ty, self.tr, self.alive):
+            if alive:
+                cv2.circle(current_layer, (int(tx), int(ty)), int(radius), (0, 255, 0), -1)
         
-        # Draw some targets as indication
-        for i, target in enumerate(self.targets):
-            if not target.is_destroyed:
-                x = int(target.x + offset_x)
-                y = int(target.y)
-                if 0 <= x < width:
-                    cv2.circle(roi, (x, y), target.radius, (0, 255, 0), -1)
-    
-    def draw_next_level_preview(self, roi, offset_x):
-        """Draw next level preview"""
-        height, width = roi.shape[:2]
+        # Next level preview: twice the frame width, so the label slides in with the screen
+        next_layer = np.zeros((height, 2 * width, 3), dtype=np.uint8)
+        cv2.rectangle(next_layer, (0, height - 50), (2 * width, height), (34, 139, 34), -1)
         
-        # Draw ground
-        cv2.rectangle(roi, (0, height - 50), (width, height), (34, 139, 34), -1)
+        # Label is alpha-blended separately, a masked copy would keep its antialiased dark edges
+        level_text = TextSprite(f"LEVEL {self.current_level}", 1, (255, 255, 0), 2)
         
-        # Draw "Next Level" text
-        cv2.putText(roi, f"LEVEL {self.current_level}", 
-                   (offset_x + 10, height//2), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 0), 2)
+        # Only drawn pixels are copied, camera feed shows through elsewhere
+        self.transition_layers = (current_layer, current_layer.any(axis=2, keepdims=True),
+                                  next_layer, next_layer.any(axis=2, keepdims=True), level_text)
     
-    def draw_ui(self, frame):
-        """Draw user interface"""
-        # Status background (expanded to show level info)
-        cv2.rectangle(frame, (5, 5), (300, 100), (0, 0, 0), -1)
-        
-        # Status text
-        status = "PULLING" if self.pulling else ("FLYING" if self.bird.is_flying else "READY")
-        cv2.putText(frame, f"Status: {status}", (10, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        cv2.putText(frame, f"Score: {self.score}", (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+    def render_hud_sprite(self, status, remaining):
+        """Render status panel (background box + text) into a sprite"""
+        sprite = np.zeros((96, 296, 3), dtype=np.uint8)  # Covers (5, 5) - (300, 100)
+        cv2.putText(sprite, f"Status: {status}", (5, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        cv2.putText(sprite, f"Score: {self.score}", (5, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
         
         # Level info
-        cv2.putText(frame, f"Level: {self.current_level}/{self.max_level}", (10, 65), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+        cv2.putText(sprite, f"Level: {self.current_level}/{self.max_level}", (5, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
         
         # Target count
-        remaining = sum(1 for target in self.targets if not target.is_destroyed)
-        cv2.putText(frame, f"Targets: {remaining}", (10, 85), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        cv2.putText(sprite, f"Targets: {remaining}", (5, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        return sprite
+    
+    def render_button_sprite(self, button_color, text_color):
+        """Render restart button body (background, progress bar, label) into a sprite"""
+        button = self.reset_button
+        width, height = button['width'], button['height']
+        sprite = np.empty((height + 1, width + 1, 3), dtype=np.uint8)
+        sprite[:] = button_color
+        
+        # Draw progress bar (if there's progress)
+        if button['progress'] > 0:
+            progress_ratio = button['progress'] / button['max_progress']
+            progress_width = int(width * progress_ratio)
+            cv2.rectangle(sprite, (0, height - 8), (progress_width, height),
+                         self.progress_color(progress_ratio), -1)
+        
+        # Draw button text
+        if button['has_triggered']:
+            # Show completed state
+            cv2.putText(sprite, "DONE", (25, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.6, text_color, 2)
+        else:
+            cv2.putText(sprite, "RESTART", (15, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.6, text_color, 2)
+        return sprite
+    
+    @staticmethod
+    def progress_color(progress_ratio):
+        """Progress bar color: from yellow to green"""
+        if progress_ratio < 0.5:
+            # Yellow to orange
+            return (0, int(255 * progress_ratio * 2), 255)
+        # Orange to green
+        return (0, 255, int(255 * (2 - progress_ratio * 2)))
+    
+    def draw_ui(self, frame):
+        """Draw user interface"""
+        # Status panel (expanded to show level info) - re-rendered only when a value changes
+        status = "PULLING" if self.pulling else ("FLYING" if self.bird.is_flying else "READY")
+        hud_key = (status, self.score, self.current_level, self.remaining_targets)
+        if hud_key != self.hud_key:
+            self.hud_key = hud_key
+            self.hud_sprite = self.render_hud_sprite(status, self.remaining_targets)
+        blit(frame, self.hud_sprite, 5, 5)
         
         # Draw restart button
         button = self.reset_button
@@ -534,48 +685,36 @@ class SimpleGame:
         # Button color changes based on state
         if button['has_triggered']:
             # Triggered state - green, indicates completed
+            state = 'done'
             button_color = (0, 200, 0)  # Green, triggered
             text_color = (255, 255, 255)
         elif button['active']:
+            state = 'active'
             button_color = (0, 200, 255)  # Bright blue, activating
             text_color = (255, 255, 255)
         elif button['hover']:
+            state = 'hover'
             button_color = (0, 150, 255)  # Blue, hovering
             text_color = (255, 255, 255)
         else:
+            state = 'idle'
             button_color = (100, 100, 100)  # Gray, normal state
             text_color = (255, 255, 255)
         
-        # Draw button background
-        cv2.rectangle(frame, 
-                     (button['x'], button['y']), 
-                     (button['x'] + button['width'], button['y'] + button['height']), 
-                     button_color, -1)
+        # Draw button background, progress bar and label from the sprite cache
+        sprite_key = (state, button['progress'])
+        sprite = self.button_sprite_cache.get(sprite_key)
+        if sprite is None:
+            sprite = self.render_button_sprite(button_color, text_color)
+            self.button_sprite_cache[sprite_key] = sprite
+        blit(frame, sprite, button['x'], button['y'])
         
-        # Draw progress bar (if there's progress)
+        # Draw progress percentage
         if button['progress'] > 0:
             progress_ratio = button['progress'] / button['max_progress']
-            progress_width = int(button['width'] * progress_ratio)
-            
-            # Progress bar color: from yellow to green
-            if progress_ratio < 0.5:
-                # Yellow to orange
-                progress_color = (0, int(255 * progress_ratio * 2), 255)
-            else:
-                # Orange to green
-                progress_color = (0, 255, int(255 * (2 - progress_ratio * 2)))
-            
-            # Draw progress bar
-            cv2.rectangle(frame,
-                         (button['x'], button['y'] + button['height'] - 8),
-                         (button['x'] + progress_width, button['y'] + button['height']),
-                         progress_color, -1)
-            
-            # Draw progress percentage
-            progress_text = f"{int(progress_ratio * 100)}%"
-            cv2.putText(frame, progress_text,
+            cv2.putText(frame, f"{int(progress_ratio * 100)}%",
                        (button['x'] + button['width'] + 10, button['y'] + 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, progress_color, 2)
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, self.progress_color(progress_ratio), 2)
         
         # Draw button border
         cv2.rectangle(frame, 
@@ -583,32 +722,32 @@ class SimpleGame:
                      (button['x'] + button['width'], button['y'] + button['height']), 
                      (255, 255, 255), 2)
         
-        # Draw button text
         if button['has_triggered']:
-            # Show completed state
-            cv2.putText(frame, "DONE", 
-                       (button['x'] + 25, button['y'] + 25), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, text_color, 2)
             # Add hint text
             cv2.putText(frame, "Leave to reset", 
                        (button['x'] + 5, button['y'] + button['height'] + 15), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.3, (255, 255, 0), 1)
-        else:
-            cv2.putText(frame, "RESTART", 
-                       (button['x'] + 15, button['y'] + 25), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, text_color, 2)
         
         # Draw expanded detection area (semi-transparent) - only show when not triggered
         if (button['hover'] or button['active']) and not button['has_triggered']:
             padding = button['detection_padding']
-            overlay = frame.copy()
+            # Only blend the region around the expanded area (border is 2px thick, clip to frame)
+            roi_x1 = max(0, button['x'] - padding - 1)
+            roi_y1 = max(0, button['y'] - padding - 1)
+            roi_x2 = min(self.width, button['x'] + button['width'] + padding + 2)
+            roi_y2 = min(self.height, button['y'] + button['height'] + padding + 2)
+            roi = frame[roi_y1:roi_y2, roi_x1:roi_x2]
+            if self.overlay_scratch is None or self.overlay_scratch.shape != roi.shape:
+                self.overlay_scratch = np.empty_like(roi)
+            overlay = self.overlay_scratch
+            np.copyto(overlay, roi)
             # Draw expanded area border
             cv2.rectangle(overlay,
-                         (button['x'] - padding, button['y'] - padding),
-                         (button['x'] + button['width'] + padding, button['y'] + button['height'] + padding),
+                         (button['x'] - padding - roi_x1, button['y'] - padding - roi_y1),
+                         (button['x'] + button['width'] + padding - roi_x1, button['y'] + button['height'] + padding - roi_y1),
                          (0, 255, 255), 2)  # Cyan border
             # Semi-transparent effect
-            cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+            cv2.addWeighted(overlay, 0.3, roi, 0.7, 0, roi)
             
             # Add hint text
             cv2.putText(frame, "Extended Area", 
@@ -624,10 +763,8 @@ class SimpleGame:
         
         # Pause state display
         if self.is_paused:
-            # Draw semi-transparent overlay
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (self.width, self.height), (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)
+            # Draw semi-transparent overlay (blending with black is just halving, done in place)
+            cv2.convertScaleAbs(frame, frame, 0.5)
             
             # Draw pause symbol
             cv2.rectangle(frame, (self.width//2 - 150, self.height//2 - 60), 
@@ -653,388 +790,444 @@ class SimpleGame:
 # Global game instance
 game = None
 
-def detect_pinch(hand_landmarks, width, height):
-    """Detect pinch gesture"""
-    if not hand_landmarks:
+def landmarks_to_array(hand_landmarks):
+    """Convert MediaPipe hand landmarks to a (21, 3) array of normalized x, y, z"""
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+# Finger landmark indices: index, middle, ring, pinky
+FINGER_TIPS = (8, 12, 16, 20)
+FINGER_PIPS = (6, 10, 14, 18)
+FINGER_MCPS = (5, 9, 13, 17)
+FINGER_TIP_INDEX = np.array(FINGER_TIPS)
+FINGER_PIP_INDEX = np.array(FINGER_PIPS)
+
+# Per-hand features shared by all gesture detectors
+HandFeatures = namedtuple('HandFeatures', [
+    'landmarks',      # (21, 3) normalized x, y, z
+    'pixels',         # (21, 2) pixel x, y
+    'fingers_up',     # Index, middle, ring, pinky: tip above PIP joint
+    'thumb_outward',  # Thumb tip right of IP joint
+])
+
+def analyze_hand(landmarks, pixels):
+    """Compute finger states once per hand for all detectors"""
+    fingers_up = landmarks[FINGER_TIP_INDEX, 1] < landmarks[FINGER_PIP_INDEX, 1]  # All four in one comparison
+    thumb_outward = landmarks[4, 0] > landmarks[3, 0]
+    return HandFeatures(landmarks, pixels, fingers_up, thumb_outward)
+
+def detect_pinch(hand):
+    """Detect pinch gesture, returns (is_pinching, center, distance); distance is 0 when not pinching"""
+    if hand is None:
         return False, (0, 0), 0
     
     # Thumb tip and index finger tip
-    thumb_tip = hand_landmarks.landmark[4]
-    index_tip = hand_landmarks.landmark[8]
-    
-    # Calculate distance
-    thumb_x = thumb_tip.x * width
-    thumb_y = thumb_tip.y * height
-    index_x = index_tip.x * width
-    index_y = index_tip.y * height
+    thumb_x, thumb_y = hand.pixels[4]
+    index_x, index_y = hand.pixels[8]
     
-    distance = math.sqrt((thumb_x - index_x)**2 + (thumb_y - index_y)**2)
+    # Calculate squared distance
+    dx = thumb_x - index_x
+    dy = thumb_y - index_y
+    distance_sq = dx * dx + dy * dy
     
     # Pinch center point
     center_x = (thumb_x + index_x) / 2
     center_y = (thumb_y + index_y) / 2
     
     # Check if pinching (distance less than 40 pixels)
-    is_pinching = distance < 40
+    is_pinching = distance_sq < 40 * 40
+    
+    # Actual distance is only displayed while pinching
+    distance = math.hypot(dx, dy) if is_pinching else 0
     
     return is_pinching, (center_x, center_y), distance
 
-def detect_pointing(hand_landmarks, width, height):
+def detect_pointing(hand):
     """Detect pointing gesture"""
-    if not hand_landmarks:
+    if hand is None:
         return False, (0, 0)
     
-    landmarks = hand_landmarks.landmark
-    
-    # Detect finger states
-    fingers_up = []
-    
-    # Thumb - improved detection logic
-    thumb_tip = landmarks[4]
-    thumb_mcp = landmarks[2]
-    if abs(thumb_tip.x - thumb_mcp.x) > 0.02:  # Whether thumb is extended (more relaxed condition)
-        fingers_up.append(1)
-    else:
-        fingers_up.append(0)
-    
-    # Other four fingers (compare y coordinates)
-    finger_tips = [8, 12, 16, 20]  # Index, middle, ring, pinky finger tips
-    finger_pips = [6, 10, 14, 18]  # Corresponding PIP joints
-    
-    for tip, pip in zip(finger_tips, finger_pips):
-        if landmarks[tip].y < landmarks[pip].y:
-            fingers_up.append(1)
-        else:
-            fingers_up.append(0)
-    
-    # More relaxed pointing gesture detection: index up, at least 2 other fingers down
-    index_up = fingers_up[1] == 1  # Index finger up
-    other_fingers_down = sum(fingers_up[2:]) <= 1  # Middle, ring, pinky: at most 1 up
+    # Get index finger tip position
+    point_x, point_y = hand.pixels[8]
     
-    is_pointing = index_up and other_fingers_down
+    # Index finger must be up, cheapest disqualifier first
+    if not hand.fingers_up[0]:
+        return False, (point_x, point_y)
     
-    # Get index finger tip position
-    index_tip = landmarks[8]
-    point_x = index_tip.x * width
-    point_y = index_tip.y * height
+    # More relaxed pointing gesture detection: middle, ring, pinky at most 1 up
+    is_pointing = np.count_nonzero(hand.fingers_up[1:]) <= 1
     
     return is_pointing, (point_x, point_y)
 
-def detect_left_swipe(hand_landmarks, width, height):
+def detect_left_swipe(hand):
     """Detect left swipe gesture"""
-    if not hand_landmarks:
+    if hand is None:
         return False, (0, 0)
     
     # Get wrist and middle finger tip positions
-    wrist = hand_landmarks.landmark[0]
-    middle_tip = hand_landmarks.landmark[12]
-    
-    wrist_x = wrist.x * width
-    middle_x = middle_tip.x * width
-    
-    # Detect open palm (multiple fingers extended)
-    landmarks = hand_landmarks.landmark
-    fingers_up = []
+    wrist_x, wrist_y = hand.pixels[0]
+    middle_x, middle_y = hand.pixels[12]
     
-    # Thumb
-    if landmarks[4].x > landmarks[3].x:
-        fingers_up.append(1)
-    else:
-        fingers_up.append(0)
-    
-    # Other four fingers
-    finger_tips = [8, 12, 16, 20]
-    finger_pips = [6, 10, 14, 18]
+    swipe_center_x = (wrist_x + middle_x) / 2
+    swipe_center_y = (wrist_y + middle_y) / 2
     
-    for tip, pip in zip(finger_tips, finger_pips):
-        if landmarks[tip].y < landmarks[pip].y:
-            fingers_up.append(1)
-        else:
-            fingers_up.append(0)
+    # Middle finger tip far left of wrist (extended left), checked before finger states
+    if not middle_x < wrist_x - 50:
+        return False, (swipe_center_x, swipe_center_y)
     
     # At least 3 fingers extended indicates open palm
-    open_palm = sum(fingers_up) >= 3
-    
-    # Middle finger tip far left of wrist (extended left)
-    is_left_extended = middle_x < wrist_x - 50
+    open_palm = hand.thumb_outward + np.count_nonzero(hand.fingers_up) >= 3
     
-    swipe_center_x = (wrist_x + middle_x) / 2
-    swipe_center_y = (wrist.y + middle_tip.y) / 2 * height
-    
-    return open_palm and is_left_extended, (swipe_center_x, swipe_center_y)
+    return open_palm, (swipe_center_x, swipe_center_y)
 
-def detect_fist(hand_landmarks):
-    """Detect fist gesture - improved version with stricter detection"""
-    if not hand_landmarks:
+@njit(cache=True, fastmath=True)
+def fist_kernel(landmarks):
+    """Fist geometry test on a (21, 3) normalized landmark array"""
+    # Condition 1 for the four fingers: fingertip below PIP joint (basic bending)
+    basic_bent_count = 0
+    for i in range(4):
+        if landmarks[FINGER_TIPS[i], 1] > landmarks[FINGER_PIPS[i], 1]:
+            basic_bent_count += 1
+    
+    # 4 properly bent fingers are required, thumb can supply at most one of them
+    if basic_bent_count < 3:
         return False
     
-    landmarks = hand_landmarks.landmark
-    
     # Get palm center point (midpoint of wrist and middle finger MCP joint)
-    wrist = landmarks[0]
-    middle_mcp = landmarks[9]
-    palm_center_x = (wrist.x + middle_mcp.x) / 2
-    palm_center_y = (wrist.y + middle_mcp.y) / 2
-    
-    # Check if all fingers are bent and close to palm
-    fingers_properly_bent = []
-    
-    # Thumb: stricter detection
-    thumb_tip = landmarks[4]
-    thumb_ip = landmarks[3]
-    thumb_mcp = landmarks[2]
-    
-    # Thumb bent: tip to palm center distance less than MCP to palm center distance
-    thumb_to_palm_dist = ((thumb_tip.x - palm_center_x)**2 + (thumb_tip.y - palm_center_y)**2)**0.5
-    thumb_mcp_to_palm_dist = ((thumb_mcp.x - palm_center_x)**2 + (thumb_mcp.y - palm_center_y)**2)**0.5
-    thumb_bent = thumb_to_palm_dist < thumb_mcp_to_palm_dist * 0.95  # Relaxed from 90% to 95%
-    fingers_properly_bent.append(thumb_bent)
+    wrist_x, wrist_y = landmarks[0, 0], landmarks[0, 1]
+    middle_mcp_x, middle_mcp_y = landmarks[9, 0], landmarks[9, 1]
+    palm_center_x = (wrist_x + middle_mcp_x) * 0.5
+    palm_center_y = (wrist_y + middle_mcp_y) * 0.5
+    
+    # All distances below are compared squared (ratios squared accordingly)
+    
+    # Thumb: stricter detection (tip = 4, MCP = 2)
+    dx = landmarks[4, 0] - palm_center_x
+    dy = landmarks[4, 1] - palm_center_y
+    thumb_to_palm_sq = dx * dx + dy * dy
+    dx = landmarks[2, 0] - palm_center_x
+    dy = landmarks[2, 1] - palm_center_y
+    thumb_mcp_to_palm_sq = dx * dx + dy * dy
+    bent_count = 0
+    if thumb_to_palm_sq < thumb_mcp_to_palm_sq * (0.95 * 0.95):  # Relaxed from 90% to 95%
+        bent_count += 1
     
     # Other four fingers: stricter bending + distance detection
-    finger_tips = [8, 12, 16, 20]  # Index, middle, ring, pinky finger tips
-    finger_pips = [6, 10, 14, 18]  # Corresponding PIP joints
-    finger_mcps = [5, 9, 13, 17]   # Corresponding MCP joints
-    
-    for tip_idx, pip_idx, mcp_idx in zip(finger_tips, finger_pips, finger_mcps):
-        # Condition 1: fingertip below PIP joint (basic bending)
-        basic_bent = landmarks[tip_idx].y > landmarks[pip_idx].y
+    for i in range(4):
+        tip, pip, mcp = FINGER_TIPS[i], FINGER_PIPS[i], FINGER_MCPS[i]
+        if not landmarks[tip, 1] > landmarks[pip, 1]:
+            continue
         
         # Condition 2: fingertip to palm center distance less than 90% of MCP to palm center distance (relaxed by 5%)
-        tip_to_palm_dist = ((landmarks[tip_idx].x - palm_center_x)**2 + 
-                           (landmarks[tip_idx].y - palm_center_y)**2)**0.5
-        mcp_to_palm_dist = ((landmarks[mcp_idx].x - palm_center_x)**2 + 
-                           (landmarks[mcp_idx].y - palm_center_y)**2)**0.5
-        close_to_palm = tip_to_palm_dist < mcp_to_palm_dist * 0.9  # Relaxed from 85% to 90%
+        dx = landmarks[tip, 0] - palm_center_x
+        dy = landmarks[tip, 1] - palm_center_y
+        tip_to_palm_sq = dx * dx + dy * dy
+        dx = landmarks[mcp, 0] - palm_center_x
+        dy = landmarks[mcp, 1] - palm_center_y
+        mcp_to_palm_sq = dx * dx + dy * dy
         
         # Both conditions must be met for proper bending
-        finger_properly_bent = basic_bent and close_to_palm
-        fingers_properly_bent.append(finger_properly_bent)
+        if tip_to_palm_sq < mcp_to_palm_sq * (0.9 * 0.9):  # Relaxed from 85% to 90%
+            bent_count += 1
     
     # Relaxed requirement: at least 4 fingers properly bent (instead of 5)
-    most_fingers_bent = sum(fingers_properly_bent) >= 4
+    if bent_count < 4:
+        return False
     
-    # Additional check: finger proximity (optional, stricter)
-    # Check if adjacent fingertips are close enough together
-    finger_tips_coords = [(landmarks[tip_idx].x, landmarks[tip_idx].y) for tip_idx in finger_tips]
-    max_finger_distance = 0
-    for i in range(len(finger_tips_coords) - 1):
-        dist = ((finger_tips_coords[i][0] - finger_tips_coords[i+1][0])**2 + 
-                (finger_tips_coords[i][1] - finger_tips_coords[i+1][1])**2)**0.5
-        max_finger_distance = max(max_finger_distance, dist)
+    # Additional check: adjacent fingertips are close enough together (all 3 pairs at once)
+    tips = landmarks[FINGER_TIP_INDEX, :2]
+    steps = tips[1:] - tips[:-1]
+    max_finger_distance_sq = (steps * steps).sum(axis=1).max()
     
     # Finger distance should not be too large (relative to palm size)
-    hand_size = ((wrist.x - middle_mcp.x)**2 + (wrist.y - middle_mcp.y)**2)**0.5
-    fingers_close_together = max_finger_distance < hand_size * 0.5  # Relaxed to 50% of palm size
-    
-    # Final decision: most fingers bent and fingers close together
-    fist_detected = most_fingers_bent and fingers_close_together
-    
-    return fist_detected
+    dx = wrist_x - middle_mcp_x
+    dy = wrist_y - middle_mcp_y
+    hand_size_sq = dx * dx + dy * dy
+    return max_finger_distance_sq < hand_size_sq * (0.5 * 0.5)  # Relaxed to 50% of palm size
+
+# Compile the kernel at import so the first video frame doesn't pay the JIT cost
+fist_kernel(np.zeros((21, 3), dtype=np.float32))
+
+def detect_fist(hand):
+    """Detect fist gesture - improved version with stricter detection"""
+    if hand is None:
+        return False
+    return bool(fist_kernel(hand.landmarks))
 
-# Global variables - wave detection
-swipe_history = []
+class WindowCounter:
+    """Sliding window of booleans with a running count of True entries"""
+    def __init__(self, size):
+        self.window = deque(maxlen=size)
+        self.count = 0
+    
+    def push(self, value):
+        """Append value, evicting the oldest entry once the window is full"""
+        if len(self.window) == self.window.maxlen and self.window[0]:
+            self.count -= 1
+        self.window.append(value)
+        if value:
+            self.count += 1
+    
+    def is_full(self):
+        """Whether the window holds size entries"""
+        return len(self.window) == self.window.maxlen
 
-# Global variables - fist detection stability
-fist_history = []
+# Global variables - wave detection (most recent 5 frames)
+swipe_history = WindowCounter(5)
 
-# Global variables - fist detection stability
-fist_history = []
+# Global variables - fist detection stability (most recent 2 frames)
+fist_history = WindowCounter(2)
 
 def update_fist_detection(is_fist_detected):
     """Update fist detection history for stability check"""
-    global fist_history
+    fist_history.push(is_fist_detected)
     
-    # Keep record of recent 3 frames (reduced requirement)
-    fist_history.append(is_fist_detected)
-    if len(fist_history) > 3:
-        fist_history.pop(0)
-    
-    # Need 2+ consecutive frames detecting fist to confirm (lowered requirement)
-    if len(fist_history) >= 2:
-        recent_fists = fist_history[-2:]
-        consecutive_fists = sum(1 for fist in recent_fists if fist)
+    # Need 2+ frames of history to confirm (lowered requirement)
+    if fist_history.is_full():
         # If 1+ frames in recent 2 frames detected fist, confirm fist state
-        return consecutive_fists >= 1
+        return fist_history.count >= 1
     
     return is_fist_detected  # If history insufficient, return current detection result
 
-def update_swipe_detection(is_swiping, position):
+def update_swipe_detection(is_swiping):
     """Update swipe detection history"""
-    global swipe_history
-    
-    # Keep record of recent 10 frames
-    swipe_history.append((is_swiping, position))
-    if len(swipe_history) > 10:
-        swipe_history.pop(0)
+    swipe_history.push(is_swiping)
     
     # Detect continuous left swipe
-    if len(swipe_history) >= 5:
-        recent_swipes = swipe_history[-5:]
-        consecutive_swipes = sum(1 for swipe, pos in recent_swipes if swipe)
-        
+    if swipe_history.is_full():
         # If 3+ frames in recent 5 frames detected swipe, trigger transition
-        return consecutive_swipes >= 3
+        return swipe_history.count >= 3
     
     return False
 
+# Static overlay text, rasterized once
+NO_HANDS_TEXT = TextSprite("No hands detected - Try moving closer to camera", 0.5, (255, 255, 0), 1)
+RESTART_HINT_TEXT = TextSprite("Or use spacebar to restart", 0.5, (255, 255, 0), 1)
+SWIPE_HINT_TEXT = TextSprite("Swipe LEFT for next level!", 0.8, (255, 255, 0), 2)
+
+class HandTracker:
+    """Run MediaPipe on a background thread, keeping only the newest frame and result"""
+    def __init__(self):
+        self.frames = queue.Queue(maxsize=1)  # Newest downscaled RGB frame waiting for inference
+        self.latest = (None, None)  # (hand_landmarks, landmark array) of newest result
+        self.thread = None  # Started on demand, exits after TRACKER_IDLE_TIMEOUT without frames
+    
+    def submit(self, rgb_img):
+        """Queue a frame for inference, replacing any frame the worker hasn't picked up yet (never raises)"""
+        try:
+            self.frames.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self.frames.put_nowait(rgb_img)
+        except queue.Full:
+            pass  # Lost a race with another submit, the queued frame is just as recent
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+    
+    def clear(self):
+        """Forget the last result so a held gesture doesn't carry over"""
+        self.latest = (None, None)
+    
+    def run(self):
+        """Worker loop"""
+        hands = get_hand_detector()
+        while True:
+            try:
+                rgb_img = self.frames.get(timeout=TRACKER_IDLE_TIMEOUT)
+            except queue.Empty:
+                # Stream stopped or the game was replaced, don't act on this hand after a reconnect
+                self.clear()
+                return
+            try:
+                results = hands.process(rgb_img)
+            except Exception:
+                # Don't keep acting on a stale hand (e.g. a held fist) while inference is failing
+                logger.exception("Hand inference failed")
+                self.clear()
+                continue
+            
+            if results.multi_hand_landmarks:
+                # Only one hand is tracked (max_num_hands=1), convert once per inference
+                hand_landmarks = results.multi_hand_landmarks[0]
+                self.latest = (hand_landmarks, landmarks_to_array(hand_landmarks))
+            else:
+                self.clear()
+
+def error_frame(frame, error):
+    """Blank frame of the input size showing an error message"""
+    img = np.zeros((frame.height, frame.width, 3), dtype=np.uint8)
+    cv2.putText(img, f"Error: {str(error)}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+    return av.VideoFrame.from_ndarray(img, format="bgr24")
+
 def video_frame_callback(frame):
     """Process video frames"""
     global game
     
+    # Only decoding the incoming frame is guarded, game and drawing errors should surface
     try:
-        img = frame.to_ndarray(format="bgr24")
-        img = cv2.flip(img, 1)
-        height, width = img.shape[:2]
-        
-        # Initialize game
-        if game is None:
-            game = SimpleGame(width, height)
-        
-        # Gesture detection
-        hands = get_hand_detector()
-        rgb_img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        results = hands.process(rgb_img)
-        
-        # Process gestures
-        is_pinching = False
-        pinch_center = (0, 0)
-        pinch_distance = 0
-        is_pointing = False
-        point_position = (0, 0)
-        is_swiping = False
-        swipe_position = (0, 0)
-        
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                # Draw hand landmarks
-                mp_drawing.draw_landmarks(img, hand_landmarks, mp_hands.HAND_CONNECTIONS)
-                
-                # Detect pinch
-                pinching, center, distance = detect_pinch(hand_landmarks, width, height)
-                if pinching:
-                    is_pinching = True
-                    pinch_center = center
-                    pinch_distance = distance
-                    
-                    # Draw pinch point
-                    cv2.circle(img, (int(center[0]), int(center[1])), 15, (0, 255, 0), -1)
-                    cv2.circle(img, (int(center[0]), int(center[1])), 20, (255, 255, 255), 2)
-                    cv2.putText(img, f"PINCH: {distance:.1f}", (int(center[0]) + 25, int(center[1])), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                
-                # Detect pointing
-                pointing, point_pos = detect_pointing(hand_landmarks, width, height)
-                if pointing:
-                    is_pointing = True
-                    point_position = point_pos
-                    
-                    # Draw pointing point
-                    cv2.circle(img, (int(point_pos[0]), int(point_pos[1])), 10, (255, 0, 0), -1)
-                    cv2.circle(img, (int(point_pos[0]), int(point_pos[1])), 15, (255, 255, 255), 2)
-                    cv2.putText(img, "POINT", (int(point_pos[0]) + 20, int(point_pos[1])), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-                    
-                    # Check button hover
-                    game.check_button_hover(point_pos[0], point_pos[1])
-                
-                # Detect left swipe
-                swiping, swipe_pos = detect_left_swipe(hand_landmarks, width, height)
-                if swiping:
-                    is_swiping = True
-                    swipe_position = swipe_pos
-                    
-                    # Draw swipe hint
-                    cv2.circle(img, (int(swipe_pos[0]), int(swipe_pos[1])), 20, (255, 255, 0), -1)
-                    cv2.circle(img, (int(swipe_pos[0]), int(swipe_pos[1])), 25, (255, 255, 255), 2)
-                    cv2.putText(img, "SWIPE LEFT", (int(swipe_pos[0]) + 30, int(swipe_pos[1])), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
-                
-                # Detect fist - using improved algorithm and stability check
-                raw_fist_detected = detect_fist(hand_landmarks)
-                stable_fist_detected = update_fist_detection(raw_fist_detected)
-                
-                if stable_fist_detected:
-                    # Update game's fist state
-                    game.fist_detected = True
-                    
-                    # Draw fist hint
-                    wrist = hand_landmarks.landmark[0]
-                    fist_x = int(wrist.x * width)
-                    fist_y = int(wrist.y * height)
-                    cv2.circle(img, (fist_x, fist_y), 25, (0, 0, 255), -1)
-                    cv2.circle(img, (fist_x, fist_y), 30, (255, 255, 255), 2)
-                    cv2.putText(img, "FIST - PAUSE", (fist_x + 35, fist_y), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 2)
-                else:
-                    game.fist_detected = False
-        
-        # Pause state management
-        game.update_pause_state()
-        
-        # Game logic - only execute when not paused
-        if not game.is_paused:
-            if is_pinching and not game.pulling:
-                game.start_pull(pinch_center[0], pinch_center[1])
-            elif is_pinching and game.pulling:
-                game.update_pull(pinch_center[0], pinch_center[1])
-            elif not is_pinching and game.pulling:
-                game.release()
-        
-            # Button progress detection
-            if is_pointing:
-                # Check button hover and update progress
-                game_reset = game.check_button_hover(point_position[0], point_position[1])
-                if game_reset:
-                    # Show restart confirmation message
-                    cv2.putText(img, "GAME RESET!", (width//2 - 100, height//2), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 3)
-            else:
-                # Not in pointing state, let button progress decay
-                game.check_button_hover(-1, -1)  # Pass invalid coordinates to decay progress
-        
-        # Fallback activation mechanism: if no hands detected but game inactive for long time, show restart hint
-        if not results.multi_hand_landmarks:
-            # No hands detected
-            cv2.putText(img, "No hands detected - Try moving closer to camera", 
-                       (10, height - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
-            cv2.putText(img, "Or use spacebar to restart", 
-                       (10, height - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
-        
-        # Swipe detection - level switching
-        level_switched = update_swipe_detection(is_swiping, swipe_position)
-        if level_switched and game.game_won and not game.is_transitioning:
-            # Only switch level when won and not in transition animation
-            if game.current_level < game.max_level:
-                game.next_level()
-                cv2.putText(img, f"NEXT LEVEL! ({game.current_level})", 
-                           (width//2 - 120, height//2 + 50), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 0), 3)
-            else:
-                cv2.putText(img, "ALL LEVELS COMPLETED!", 
-                           (width//2 - 150, height//2 + 50), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 3)
-        
-        # Show swipe hint (only when won)
-        if game.game_won and not game.is_transitioning and game.current_level < game.max_level:
-            cv2.putText(img, "Swipe LEFT for next level!", 
-                       (width//2 - 150, height - 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2)
-        
-        pointing_last_frame = is_pointing
-        
-        # Update and draw game - only update game logic when not paused
-        if not game.is_paused:
-            game.update()
-        game.draw(img)
+        raw_img = frame.to_ndarray(format="bgr24")
+    except Exception as e:
+        return error_frame(frame, e)
+    
+    height, width = raw_img.shape[:2]
+    
+    # Initialize game
+    if game is None:
+        game = SimpleGame(width, height)
+    
+    # Mirror into the game's reused buffer (from_ndarray copies it into the output frame)
+    img = cv2.flip(raw_img, 1, dst=game.frame_buffers.get('mirrored', raw_img.shape))
+    
+    # Gesture detection - submit every PREDICTION_INTERVAL frames, inference runs on the tracker thread
+    tracker = game.tracker
+    game.frame_index += 1
+    if game.frame_index % PREDICTION_INTERVAL == 0:
+        # Downscale before inference, keep aspect ratio so hand shape isn't distorted
+        # (fresh array each time, the tracker thread keeps a reference)
+        small_img = cv2.resize(img, game.detection_size, interpolation=cv2.INTER_AREA)
+        # Mirror was applied once on the full frame (needed for display), so only the
+        # downscaled copy needs the channel swap, done in place
+        rgb_img = cv2.cvtColor(small_img, cv2.COLOR_BGR2RGB, dst=small_img)
+        tracker.submit(rgb_img)
+    
+    # Use the newest finished result, never wait for inference
+    hand_landmarks, landmarks = tracker.latest
+    
+    # Process gestures
+    is_pinching = False
+    pinch_center = (0, 0)
+    pinch_distance = 0
+    is_pointing = False
+    point_position = (0, 0)
+    is_swiping = False
+    
+    if hand_landmarks is not None:
+        # Draw hand landmarks
+        if SHOW_LANDMARKS:
+            mp_drawing.draw_landmarks(img, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+        
+        # Landmarks already converted at inference time, all pixel coordinates in a single multiply
+        pixels = np.multiply(landmarks[:, :2], game.pixel_scale, out=game.pixel_buffer)
+        hand = analyze_hand(landmarks, pixels)
+        
+        # Detect pinch
+        pinching, center, distance = detect_pinch(hand)
+        if pinching:
+            is_pinching = True
+            pinch_center = center
+            pinch_distance = distance
+            
+            # Draw pinch point
+            pinch_x, pinch_y = int(center[0]), int(center[1])
+            cv2.circle(img, (pinch_x, pinch_y), 15, (0, 255, 0), -1)
+            cv2.circle(img, (pinch_x, pinch_y), 20, (255, 255, 255), 2)
+            cv2.putText(img, f"PINCH: {distance:.1f}", (pinch_x + 25, pinch_y), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        
+        # Detect pointing
+        pointing, point_pos = detect_pointing(hand)
+        if pointing:
+            is_pointing = True
+            point_position = point_pos
+            
+            # Draw pointing point
+            point_x, point_y = int(point_pos[0]), int(point_pos[1])
+            cv2.circle(img, (point_x, point_y), 10, (255, 0, 0), -1)
+            cv2.circle(img, (point_x, point_y), 15, (255, 255, 255), 2)
+            cv2.putText(img, "POINT", (point_x + 20, point_y), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+            
+            # Check button hover
+            game.check_button_hover(point_pos[0], point_pos[1])
         
-        return av.VideoFrame.from_ndarray(img, format="bgr24")
+        # Detect left swipe
+        swiping, swipe_pos = detect_left_swipe(hand)
+        if swiping:
+            is_swiping = True
+            
+            # Draw swipe hint
+            swipe_x, swipe_y = int(swipe_pos[0]), int(swipe_pos[1])
+            cv2.circle(img, (swipe_x, swipe_y), 20, (255, 255, 0), -1)
+            cv2.circle(img, (swipe_x, swipe_y), 25, (255, 255, 255), 2)
+            cv2.putText(img, "SWIPE LEFT", (swipe_x + 30, swipe_y), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
+        
+        # Detect fist - using improved algorithm and stability check
+        raw_fist_detected = detect_fist(hand)
+        stable_fist_detected = update_fist_detection(raw_fist_detected)
+        
+        if stable_fist_detected:
+            # Update game's fist state
+            game.fist_detected = True
+            
+            # Draw fist hint
+            fist_x = int(pixels[0, 0])
+            fist_y = int(pixels[0, 1])
+            cv2.circle(img, (fist_x, fist_y), 25, (0, 0, 255), -1)
+            cv2.circle(img, (fist_x, fist_y), 30, (255, 255, 255), 2)
+            cv2.putText(img, "FIST - PAUSE", (fist_x + 35, fist_y), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 2)
+        else:
+            game.fist_detected = False
+    
+    # Pause state management
+    game.update_pause_state()
+    
+    # Game logic - only execute when not paused
+    if not game.is_paused:
+        if is_pinching and not game.pulling:
+            game.start_pull(pinch_center[0], pinch_center[1])
+        elif is_pinching and game.pulling:
+            game.update_pull(pinch_center[0], pinch_center[1])
+        elif not is_pinching and game.pulling:
+            game.release()
+    
+        # Button progress detection
+        if is_pointing:
+            # Check button hover and update progress
+            game_reset = game.check_button_hover(point_position[0], point_position[1])
+            if game_reset:
+                # Show restart confirmation message
+                cv2.putText(img, "GAME RESET!", (width//2 - 100, height//2), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 3)
+        elif game.reset_button['progress'] > 0 or game.reset_button['was_in_area']:
+            # Not in pointing state, let button progress decay (or register leaving the area);
+            # once idle with zero progress there is nothing left to update
+            game.check_button_hover(-1, -1)  # Pass invalid coordinates to decay progress
+    
+    # Fallback activation mechanism: if no hands detected but game inactive for long time, show restart hint
+    if hand_landmarks is None:
+        # No hands detected
+        NO_HANDS_TEXT.draw(img, 10, height - 20)
+        RESTART_HINT_TEXT.draw(img, 10, height - 5)
+    
+    # Swipe detection - level switching
+    level_switched = update_swipe_detection(is_swiping)
+    if level_switched and game.game_won and not game.is_transitioning:
+        # Only switch level when won and not in transition animation
+        if game.current_level < game.max_level:
+            game.next_level()
+            cv2.putText(img, f"NEXT LEVEL! ({game.current_level})", 
+                       (width//2 - 120, height//2 + 50), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 0), 3)
+        else:
+            cv2.putText(img, "ALL LEVELS COMPLETED!", 
+                       (width//2 - 150, height//2 + 50), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 3)
     
-    except Exception as e:
-        # Error handling
-        img = frame.to_ndarray(format="bgr24")
-        img = cv2.flip(img, 1)
-        cv2.putText(img, f"Error: {str(e)}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-        return av.VideoFrame.from_ndarray(img, format="bgr24")
+    # Show swipe hint (only when won)
+    if game.game_won and not game.is_transitioning and game.current_level < game.max_level:
+        SWIPE_HINT_TEXT.draw(img, width//2 - 150, height - 30)
+    
+    pointing_last_frame = is_pointing
+    
+    # Update and draw game - only update game logic when not paused
+    if not game.is_paused:
+        game.update()
+    game.draw(img)
+    
+    return av.VideoFrame.from_ndarray(img, format="bgr24")
 
 def main():
     """Main function"""
@@ -1058,6 +1251,11 @@ def main():
                 game.reset_game()
             st.success("Game Reset!")
         
+        # Hand skeleton overlay (off by default, costs a few hundred draw calls per frame).
+        # Each session's script run has its own module globals, so this stays per session
+        global SHOW_LANDMARKS
+        SHOW_LANDMARKS = st.checkbox("✋ Show Hand Landmarks", value=False)
+        
         st.markdown("---")
         
         st.header("🕹️ Controls")
@@ -1104,7 +1302,10 @@ def main():
             mode=WebRtcMode.SENDRECV,
             rtc_configuration=RTC_CONFIGURATION,
             video_frame_callback=video_frame_callback,
-            media_stream_constraints={"video": True, "audio": False}
+            media_stream_constraints={"video": True, "audio": False},
+            # Stale frame dropping is delegated to streamlit-webrtc: its async worker only processes
+            # the newest queued frame. Keep this on so a backlog of old frames can't build up
+            async_processing=True
         )
     
     with col2: